@@ -1,7 +1,12 @@
+import numpy as np
+import pytest
+
 from .ethane_input import freqs, masses, coords, principal_moments, T, linear, mass_kg, elec_energy
-from thermochemistry_library.hessian.enthalpy import Enthalpy
+from thermochemistry_library.hessian.enthalpy import Enthalpy, batch_thermal_enthalpy
 from thermochemistry_library.hessian.entropy import Entropy
 from thermochemistry_library.hessian.gibbs import Gibbs
+from thermochemistry_library.hessian.thermo import calculate_thermo, calculate_thermo_scan
+from thermochemistry_library.hessian.vibration import VibrationalAnalysis
 
 def test_ethane_properties():
     enthalpy = Enthalpy(freqs_cm=freqs, T=T, linear=linear, electronic_energy=elec_energy)
@@ -15,5 +20,142 @@ def test_ethane_properties():
     print(f"S = {S} J/mol·K")
     print(f"G = {G} kJ/mol")
 
+
+def test_imaginary_modes_are_ignored():
+    with_imaginary_freqs = np.concatenate(([-150.0, 0.0], freqs))
+
+    enthalpy = Enthalpy(freqs_cm=freqs, T=T, linear=linear, electronic_energy=elec_energy)
+    entropy = Entropy(T=T, mass_kg=mass_kg, principal_moments=principal_moments,
+                      frequencies_cm=freqs, linear=linear)
+    enthalpy_imag = Enthalpy(freqs_cm=with_imaginary_freqs, T=T, linear=linear,
+                             electronic_energy=elec_energy)
+    entropy_imag = Entropy(T=T, mass_kg=mass_kg, principal_moments=principal_moments,
+                           frequencies_cm=with_imaginary_freqs, linear=linear)
+
+    assert np.isclose(enthalpy_imag.zero_point_energy(), enthalpy.zero_point_energy())
+    assert np.isclose(enthalpy_imag.vibrational_energy(), enthalpy.vibrational_energy())
+    assert np.isclose(entropy_imag.vibrational_entropy(), entropy.vibrational_entropy())
+
+    # an indefinite Hessian gives imaginary modes, which calculate_thermo must skip
+    rng = np.random.default_rng(0)
+    A = rng.normal(size=(3 * len(masses), 3 * len(masses)))
+    hessian = A @ A.T / len(A) - 0.5 * np.eye(len(A))
+    vib = VibrationalAnalysis(hessian, masses, coords)
+    vib_freqs = vib.run()["frequencies"]
+    real_freqs = vib_freqs[vib_freqs > 0]
+    assert (vib_freqs < 0).any()
+
+    result = calculate_thermo(hessian, masses, coords, T, electronic_energy=elec_energy)
+
+    expected_enthalpy = Enthalpy(freqs_cm=real_freqs, T=T, linear=vib.is_linear,
+                                 electronic_energy=elec_energy)
+    expected_entropy = Entropy(T=T, mass_kg=np.sum(masses) * 1.66053906660e-27,
+                               principal_moments=vib.principal_moments(),
+                               frequencies_cm=real_freqs, linear=vib.is_linear)
+    assert np.isclose(result.enthalpy, expected_enthalpy.total_enthalpy() / 1000.0)
+    assert np.isclose(result.entropy, expected_entropy.total_entropy())
+    expected_gibbs = Gibbs(expected_enthalpy, expected_entropy)
+    assert np.isclose(result.gibbs_energy, expected_gibbs.gibbs_energy())
+    assert np.isclose(result.zero_point_energy, expected_enthalpy.zero_point_energy() / 1000.0)
+
+
+def test_batch_thermal_enthalpy_matches_enthalpy():
+    short = freqs[:6]
+    padded = np.zeros((3, len(freqs)))
+    padded[0] = freqs
+    padded[1, : len(short)] = short
+    padded[2] = freqs
+    linear_mask = np.array([False, False, True])
+
+    H = batch_thermal_enthalpy(padded, T, linear_mask)
+
+    expected = [
+        Enthalpy(freqs_cm=freqs, T=T).total_enthalpy(),
+        Enthalpy(freqs_cm=short, T=T).total_enthalpy(),
+        Enthalpy(freqs_cm=freqs, T=T, linear=True).total_enthalpy(),
+    ]
+    assert np.allclose(H, expected)
+
+    # an array of temperatures would broadcast against the modes, not the molecules
+    with pytest.raises(ValueError, match="single temperature"):
+        batch_thermal_enthalpy(padded, np.full(len(freqs), T), linear_mask)
+
+
+def test_float32_kernels_match_float64():
+    enthalpy = Enthalpy(freqs_cm=freqs, T=T, linear=linear)
+    entropy = Entropy(T=T, mass_kg=mass_kg, principal_moments=principal_moments,
+                      frequencies_cm=freqs, linear=linear)
+    enthalpy32 = Enthalpy(freqs_cm=freqs, T=T, linear=linear, dtype=np.float32)
+    entropy32 = Entropy(
+        T=T,
+        mass_kg=mass_kg,
+        principal_moments=principal_moments,
+        frequencies_cm=freqs,
+        linear=linear,
+        dtype=np.float32,
+    )
+
+    assert entropy32.freqs.dtype == np.float32
+    assert np.isclose(enthalpy32.vibrational_energy(), enthalpy.vibrational_energy(), rtol=1e-6)
+    assert np.isclose(entropy32.vibrational_entropy(), entropy.vibrational_entropy(), rtol=1e-5)
+    assert np.isclose(entropy32.total_entropy(), entropy.total_entropy(), rtol=1e-6)
+
+    # at 40 K, x = theta / T for a 3500 cm^-1 stretch is beyond the float32 range of exp(x)
+    with np.errstate(over="raise"):
+        cold = Enthalpy(freqs_cm=[3500.0, 100.0], T=40.0).vibrational_energy()
+        cold32 = Enthalpy(freqs_cm=[3500.0, 100.0], T=40.0, dtype=np.float32).vibrational_energy()
+    assert np.isclose(cold32, cold, rtol=1e-6)
+
+
+def test_calculate_thermo_scan_matches_calculate_thermo():
+    rng = np.random.default_rng(0)
+    A = rng.normal(size=(3 * len(masses), 3 * len(masses)))
+    hessian = A @ A.T / len(A)
+    temperatures = np.array([100.0, T, 500.0])
+
+    scan = calculate_thermo_scan(hessian, masses, coords, temperatures,
+                                 electronic_energy=elec_energy)
+
+    for i, temperature in enumerate(temperatures):
+        single = calculate_thermo(hessian, masses, coords, temperature,
+                                  electronic_energy=elec_energy)
+        assert np.isclose(scan.enthalpy[i], single.enthalpy)
+        assert np.isclose(scan.entropy[i], single.entropy)
+        assert np.isclose(scan.gibbs_energy[i], single.gibbs_energy)
+        assert np.isclose(scan.zero_point_energy, single.zero_point_energy)
+
+
+def test_array_temperature_broadcasts_with_float64_dtype():
+    temperatures = np.array([100.0, T, 500.0])
+    enthalpy = Enthalpy(freqs_cm=freqs, T=temperatures, linear=linear, dtype=float)
+    entropy = Entropy(T=temperatures, mass_kg=mass_kg, principal_moments=principal_moments,
+                      frequencies_cm=freqs, linear=linear, dtype=float)
+
+    for i, temperature in enumerate(temperatures):
+        single_enthalpy = Enthalpy(freqs_cm=freqs, T=temperature, linear=linear)
+        single_entropy = Entropy(T=temperature, mass_kg=mass_kg,
+                                 principal_moments=principal_moments,
+                                 frequencies_cm=freqs, linear=linear)
+        assert np.isclose(enthalpy.total_enthalpy()[i], single_enthalpy.total_enthalpy())
+        assert np.isclose(entropy.total_entropy()[i], single_entropy.total_entropy())
+
+
+def test_changing_temperature_invalidates_cached_terms():
+    enthalpy = Enthalpy(freqs_cm=freqs, T=T, linear=linear)
+    entropy = Entropy(T=T, mass_kg=mass_kg, principal_moments=principal_moments,
+                      frequencies_cm=freqs, linear=linear)
+    enthalpy.total_enthalpy()
+    entropy.total_entropy()
+
+    enthalpy.T = 500.0
+    entropy.T = 500.0
+
+    fresh_enthalpy = Enthalpy(freqs_cm=freqs, T=500.0, linear=linear)
+    fresh_entropy = Entropy(T=500.0, mass_kg=mass_kg, principal_moments=principal_moments,
+                            frequencies_cm=freqs, linear=linear)
+    assert np.isclose(enthalpy.total_enthalpy(), fresh_enthalpy.total_enthalpy())
+    assert np.isclose(entropy.total_entropy(), fresh_entropy.total_entropy())
+
+
 if __name__ == "__main__":
     test_ethane_properties()
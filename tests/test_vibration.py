@@ -0,0 +1,105 @@
+import numpy as np
+
+from thermochemistry_library.hessian.vibration import VibrationalAnalysis
+
+water_masses = np.array([15.99491, 1.00783, 1.00783])
+water_coords = np.array([
+    [0.000000, 0.000000, 0.117300],
+    [0.000000, 0.757200, -0.469200],
+    [0.000000, -0.757200, -0.469200],
+])
+
+# linear, and shifted off the origin so the center of mass is exercised
+co2_masses = np.array([12.00000, 15.99491, 15.99491])
+co2_coords = np.array([
+    [0.000000, 0.000000, 0.000000],
+    [1.160000, 0.000000, 0.000000],
+    [-1.160000, 0.000000, 0.000000],
+]) + np.array([0.3, -0.2, 0.5])
+
+
+def spring_hessian(coords, springs):
+    # Hessian of harmonic springs (i, j, k) between atoms, invariant to translation/rotation
+    H = np.zeros((3 * len(coords), 3 * len(coords)))
+    for i, j, k in springs:
+        u = coords[j] - coords[i]
+        block = k * np.outer(u, u) / np.dot(u, u)
+        for a, b, sign in ((i, i, 1), (j, j, 1), (i, j, -1), (j, i, -1)):
+            H[3 * a : 3 * a + 3, 3 * b : 3 * b + 3] += sign * block
+    return H
+
+
+def co2_hessian():
+    H = spring_hessian(co2_coords, [(0, 1, 1.0), (0, 2, 1.0)])
+    # bending about the C atom, in both directions perpendicular to the molecular axis
+    bend = np.array([-2.0, 1.0, 1.0]) / 1.16
+    for axis in (1, 2):
+        v = np.zeros(9)
+        v[axis::3] = bend
+        H += 0.1 * np.outer(v, v)
+    return H
+
+
+def test_run_nonlinear():
+    hessian = spring_hessian(water_coords, [(0, 1, 0.5), (0, 2, 0.5), (1, 2, 0.05)])
+    vib = VibrationalAnalysis(hessian, water_masses, water_coords)
+    results = vib.run()
+
+    assert not vib.is_linear
+    assert vib._generate_translation_rotation_vectors().shape == (6, 9)
+    assert results["eigenvectors"].shape == (9, 3)
+    assert np.allclose(results["frequencies"], [513.563295075, 1990.0309968399, 2077.2618021722])
+    assert np.allclose(results["reduced_masses"], [1.0855191591, 1.0818419141, 1.0425414176])
+    assert np.allclose(results["force_constants"], [0.1686843984, 2.5242534346, 2.6504844341])
+    assert np.allclose(results["principal"], [0.6157545838, 1.1556823698, 1.7714369536])
+
+
+def test_run_linear():
+    vib = VibrationalAnalysis(co2_hessian(), co2_masses, co2_coords)
+    results = vib.run()
+
+    # the rotation about the molecular axis is dropped, leaving 3N - 5 modes
+    assert vib.is_linear
+    assert vib._generate_translation_rotation_vectors().shape == (5, 9)
+    assert results["eigenvectors"].shape == (9, 4)
+    assert np.allclose(
+        results["frequencies"], [502.0613438574, 502.0613438574, 680.1650406895, 1302.2662207385]
+    )
+    assert np.allclose(
+        results["reduced_masses"], [12.8773670818, 12.8773670818, 15.99491, 12.8773670818]
+    )
+    assert np.allclose(
+        results["force_constants"], [1.9124501102, 1.9124501102, 4.3597329049, 12.8669643417]
+    )
+    assert np.allclose(results["principal"], [0.0, 43.045501792, 43.045501792])
+
+
+def test_changing_geometry_invalidates_cached_terms():
+    vib = VibrationalAnalysis(np.eye(9), water_masses, water_coords)
+    vib.principal_moments()
+
+    stretched = water_coords * 1.1
+    vib.coords = stretched
+
+    fresh = VibrationalAnalysis(np.eye(9), water_masses, stretched)
+    assert np.allclose(vib.center_of_mass(), fresh.center_of_mass())
+    assert np.allclose(vib.inertia_tensor(), fresh.inertia_tensor())
+    assert np.allclose(vib.principal_moments(), fresh.principal_moments())
+
+
+def test_modifying_returned_arrays_leaves_cache_intact():
+    vib = VibrationalAnalysis(co2_hessian(), co2_masses, co2_coords)
+    principal = vib.run()["principal"].copy()
+    com = vib.center_of_mass().copy()
+    inertia = vib.inertia_tensor().copy()
+
+    moments = vib.principal_moments()
+    moments *= 1.66053907e-47
+    moments[0] = 1.0
+    vib.center_of_mass()[:] = 0.0
+    vib.inertia_tensor()[:] = 0.0
+
+    assert vib.is_linear
+    assert np.array_equal(vib.principal_moments(), principal)
+    assert np.array_equal(vib.center_of_mass(), com)
+    assert np.array_equal(vib.inertia_tensor(), inertia)
@@ -1,4 +1,4 @@
-from .enthalpy import Enthalpy
+from .enthalpy import Enthalpy, batch_thermal_enthalpy
 from .entropy import Entropy
 from .gibbs import Gibbs
-from .thermo import ThermoResults, calculate_thermo
\ No newline at end of file
+from .thermo import ThermoResults, ThermoScanResults, calculate_thermo, calculate_thermo_scan
\ No newline at end of file
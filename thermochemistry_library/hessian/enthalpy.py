@@ -1,5 +1,5 @@
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 h = 6.62607015e-34
 c = 2.99792458e10
@@ -7,25 +7,42 @@ kB = 1.380649e-23
 R = 8.31446262
 NA = 6.02214076e23
 HARTREE_TO_JOULES = 4.3597447222071e-18
+THETA_SCALE = h * c / kB  # cm^-1 -> K
 
-@dataclass
+@dataclass(slots=True)
 class Enthalpy:
     freqs_cm: np.ndarray
-    T: float
+    T: float | np.ndarray  # K; an array of temperatures gives array-valued results
     linear: bool = False
     electronic_energy: float = 0.0  # in Hartrees
+    dtype: type = np.float64  # storage/compute dtype of the frequency kernels
+
+    freqs: np.ndarray = field(init=False, repr=False)
+    _valid_freqs: np.ndarray = field(init=False, repr=False)
+
+    # vibrational energy cache, keyed on the T it was computed at
+    _Evib: float = field(init=False, default=None, repr=False)
+    _Evib_T: np.ndarray = field(init=False, default=None, repr=False)
 
     def __post_init__(self):
-        self.freqs = np.array(self.freqs_cm)
+        self.freqs = np.asarray(self.freqs_cm, dtype=self.dtype)
+        # imaginary and zero modes carry no vibrational energy
+        self._valid_freqs = np.ascontiguousarray(self.freqs[self.freqs > 0])
 
     def zero_point_energy(self):
-        return 0.5 * h * c * np.sum(self.freqs) * NA
+        return 0.5 * h * c * float(np.sum(self._valid_freqs, dtype=np.float64)) * NA
 
     def vibrational_energy(self):
-        theta = (h * c * self.freqs) / kB
-        x = theta / self.T
-        Evib = R * np.sum(theta / (np.exp(x) - 1))
-        return Evib
+        if self._Evib is None or not np.array_equal(self._Evib_T, self.T):
+            # R * sum(theta / expm1(theta / T)) with x = theta / T, broadcast over T
+            T_scale = np.asarray(THETA_SCALE / self.T, dtype=self.dtype)
+            x = np.multiply.outer(T_scale, self._valid_freqs)
+            # x / expm1(x) == x * e / (1 - e) with e = exp(-x), which underflows
+            # to 0 instead of overflowing at large x (low T, float32)
+            e = np.exp(-x)
+            self._Evib = R * self.T * np.sum(x * e / (1.0 - e), axis=-1, dtype=np.float64)
+            self._Evib_T = np.copy(self.T)
+        return self._Evib
 
     def translational_energy(self):
         return 1.5 * R * self.T
@@ -49,3 +66,28 @@ class Enthalpy:
              return E_elec_J_mol + self.zero_point_energy() + H_thermal
         
         return H_thermal
+
+def batch_thermal_enthalpy(freqs_2d, T, linear_mask=None):
+    """
+    Return the thermal enthalpy in J/mol of a batch of M molecules at one temperature.
+
+    freqs_2d is an (M, n_modes) array in cm^-1, zero-padded to a common length; non-positive
+    entries are ignored. linear_mask flags the linear molecules (default: none). T must be a
+    scalar. As with Enthalpy.total_enthalpy without an electronic energy, no ZPE is included.
+    """
+    if np.ndim(T) != 0:
+        raise ValueError("batch_thermal_enthalpy takes a single temperature")
+    freqs = np.asarray(freqs_2d, dtype=np.float64)
+    valid = freqs > 0
+    if linear_mask is None:
+        linear_mask = np.zeros(freqs.shape[0], dtype=bool)
+
+    x = (THETA_SCALE / T) * np.where(valid, freqs, 1.0)
+    e = np.exp(-x)
+    Evib = R * T * np.sum(np.where(valid, x * e / (1.0 - e), 0.0), axis=1)
+
+    # translational, rotational and PV terms from Enthalpy itself, for each rotor type
+    no_modes = np.empty(0)
+    H_nonlinear = Enthalpy(freqs_cm=no_modes, T=T).total_enthalpy()
+    H_linear = Enthalpy(freqs_cm=no_modes, T=T, linear=True).total_enthalpy()
+    return Evib + np.where(linear_mask, H_linear, H_nonlinear)
@@ -1,5 +1,5 @@
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 c = 2.99792458e10
 R = 8.314462618
@@ -7,47 +7,72 @@ h = 6.62607015e-34
 kB = 1.380649e-23
 NA = 6.02214076e23
 p0 = 1.0e5
+THETA_SCALE = h * c / kB  # cm^-1 -> K
+ROT_SCALE = 8 * np.pi**2 * kB / h**2
+TRANS_SCALE = 2 * np.pi * kB / h**2
+AMU_A2_TO_SI = 1.66053907e-47  # amu*A^2 -> kg*m^2
+AMU_A2_TO_SI_1_5 = AMU_A2_TO_SI**1.5
+R_LOG_2446 = R * np.log(24.46)  # 1 atm -> 1 M standard state
 
-@dataclass
+@dataclass(slots=True)
 class Entropy:
-    T: float
+    T: float | np.ndarray  # K; an array of temperatures gives array-valued results
     mass_kg: float
     principal_moments: np.ndarray
     frequencies_cm: np.ndarray
     linear: bool = False
+    dtype: type = np.float64  # storage/compute dtype of the frequency kernels
+
+    m: float = field(init=False, repr=False)
+    Ia: float = field(init=False, repr=False)
+    Ib: float = field(init=False, repr=False)
+    Ic: float = field(init=False, repr=False)
+    freqs: np.ndarray = field(init=False, repr=False)
+    sigma: int = field(init=False, repr=False)
+    g_e: int = field(init=False, repr=False)
+    _IaIbIc: float = field(init=False, repr=False)
+    _valid_freqs: np.ndarray = field(init=False, repr=False)
+
+    # vibrational entropy cache, keyed on the T it was computed at
+    _Svib: float = field(init=False, default=None, repr=False)
+    _Svib_T: np.ndarray = field(init=False, default=None, repr=False)
 
     def __post_init__(self):
         self.m = self.mass_kg
-        self.Ia, self.Ib, self.Ic = np.array(self.principal_moments)
-        self.freqs = np.array(self.frequencies_cm)
+        self.Ia, self.Ib, self.Ic = np.asarray(self.principal_moments, dtype=np.float64)
+        self._IaIbIc = self.Ia * self.Ib * self.Ic
+        self.freqs = np.asarray(self.frequencies_cm, dtype=self.dtype)
+        # imaginary and zero modes carry no vibrational entropy
+        self._valid_freqs = np.ascontiguousarray(self.freqs[self.freqs > 0])
         self.sigma = 1
         self.g_e = 1
 
     def translational_entropy(self):
-        term1 = ((2 * np.pi * self.m * kB * self.T) / (h**2)) ** 1.5
-        term2 = (kB * self.T) / p0
-        Strans = R * (np.log(term1 * term2) + 2.5)
+        Strans = R * (1.5 * np.log(TRANS_SCALE * self.m * self.T) + np.log(kB * self.T / p0) + 2.5)
         return Strans
 
     def rotational_entropy(self):
         if self.linear:
-            I = ((self.Ib + self.Ic) / 2) * 1.66053907e-47
-            Srot = R * (np.log((self.T / self.sigma) * (8 * np.pi**2 * kB * I / h**2)) + 1)
+            I = ((self.Ib + self.Ic) / 2) * AMU_A2_TO_SI
+            Srot = R * (np.log((self.T / self.sigma) * ROT_SCALE * I) + 1)
         else:
-            Ia, Ib, Ic = (np.array([self.Ia, self.Ib, self.Ic]) * 1.66053907e-47)
-            Srot = R * (np.log((np.sqrt(np.pi) / self.sigma) * ((8 * np.pi**2 * kB * self.T / h**2) ** 1.5) * np.sqrt(Ia * Ib * Ic)) + 1.5)
+            sqrt_IaIbIc = np.sqrt(self._IaIbIc) * AMU_A2_TO_SI_1_5
+            q_rot = (np.sqrt(np.pi) / self.sigma) * (ROT_SCALE * self.T) ** 1.5 * sqrt_IaIbIc
+            Srot = R * (np.log(q_rot) + 1.5)
         return Srot
     
     def vibrational_entropy(self):
-        theta = (h * c * self.freqs) / kB
-        x = theta / self.T
-        term1 = x / np.expm1(x)
-        term2 = -np.log(1 - np.exp(-x))
-        Svib_mode = term1 + term2
-        return R * np.sum(Svib_mode)
+        if self._Svib is None or not np.array_equal(self._Svib_T, self.T):
+            T_scale = np.asarray(THETA_SCALE / self.T, dtype=self.dtype)
+            x = np.multiply.outer(T_scale, self._valid_freqs)
+            # x / expm1(x) == x * e / (1 - e) with e = exp(-x), one exp per mode
+            e = np.exp(-x)
+            self._Svib = R * np.sum(x * e / (1.0 - e) - np.log1p(-e), axis=-1, dtype=np.float64)
+            self._Svib_T = np.copy(self.T)
+        return self._Svib
 
     def total_entropy(self, correction_1M=True):
         S = (self.translational_entropy() + self.rotational_entropy() + self.vibrational_entropy())
         if correction_1M:
-            S += R * np.log(24.46)
+            S += R_LOG_2446
         return S
\ No newline at end of file
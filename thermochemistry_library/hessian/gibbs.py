@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import numpy as np
 from .enthalpy import Enthalpy
 from .entropy import Entropy
 
@@ -7,10 +8,11 @@ c = 2.99792458e10
 R = 8.314462618
 NA = 6.02214076e23
 
-@dataclass
+@dataclass(slots=True)
 class Gibbs:
     enthalpy: Enthalpy
     entropy: Entropy
+    T: float | np.ndarray = field(init=False, repr=False)
 
     def __post_init__(self):
         self.T = self.enthalpy.T
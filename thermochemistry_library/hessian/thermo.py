@@ -5,13 +5,21 @@ from .entropy import Entropy
 from .gibbs import Gibbs
 from .vibration import VibrationalAnalysis
 
-@dataclass
+@dataclass(slots=True)
 class ThermoResults:
     enthalpy: float
     entropy: float
     gibbs_energy: float
     zero_point_energy: float
 
+@dataclass(slots=True)
+class ThermoScanResults:
+    temperatures: np.ndarray
+    enthalpy: np.ndarray
+    entropy: np.ndarray
+    gibbs_energy: np.ndarray
+    zero_point_energy: float
+
 def calculate_thermo(
     hessian: np.ndarray,
     masses: np.ndarray,
@@ -21,18 +29,43 @@ def calculate_thermo(
     correction_1M: bool = True,
     electronic_energy: float = 0.0
 ) -> ThermoResults:
-    
+    return ThermoResults(*_thermo_from_hessian(
+        hessian, masses, coords, T,
+        correction_1M=correction_1M, electronic_energy=electronic_energy
+    ))
+
+def calculate_thermo_scan(
+    hessian: np.ndarray,
+    masses: np.ndarray,
+    coords: np.ndarray,
+    temperatures: np.ndarray,
+    correction_1M: bool = True,
+    electronic_energy: float = 0.0
+) -> ThermoScanResults:
+    """
+    Evaluate calculate_thermo at every temperature in `temperatures` at once.
+
+    The vibrational analysis is run a single time; enthalpy, entropy and gibbs_energy are
+    returned as arrays over temperature, zero_point_energy as a scalar.
+    """
+    T = np.asarray(temperatures, dtype=np.float64)
+    return ThermoScanResults(T, *_thermo_from_hessian(
+        hessian, masses, coords, T,
+        correction_1M=correction_1M, electronic_energy=electronic_energy
+    ))
+
+def _thermo_from_hessian(hessian, masses, coords, T, *, correction_1M, electronic_energy):
     # 1. Run Vibrational Analysis
     vib = VibrationalAnalysis(hessian, masses, coords)
-    vib_results = vib.run()
-    
-    freqs = vib_results["frequencies"]
-    principal_moments = vib_results["principal"]
+    vib.run()
+
+    freqs = vib.frequencies
+    principal_moments = vib.principal_moments()
     
     is_linear = vib.is_linear
     
     # 2. Prepare inputs for Enthalpy/Entropy
-    total_mass_amu = np.sum(masses)
+    total_mass_amu = np.sum(vib.masses)
     total_mass_kg = total_mass_amu * 1.66053906660e-27
     
     # 3. Calculate Thermochemistry
@@ -45,10 +78,11 @@ def calculate_thermo(
         linear=is_linear
     )
     gibbs_calc = Gibbs(enthalpy_calc, entropy_calc)
-    
-    return ThermoResults(
-        enthalpy=enthalpy_calc.total_enthalpy() / 1000.0,
-        entropy=entropy_calc.total_entropy(correction_1M=correction_1M),
-        gibbs_energy=gibbs_calc.gibbs_energy(),
-        zero_point_energy=enthalpy_calc.zero_point_energy() / 1000.0
+
+    # enthalpy, entropy, gibbs_energy, zero_point_energy, in the results field order
+    return (
+        enthalpy_calc.total_enthalpy() / 1000.0,
+        entropy_calc.total_entropy(correction_1M=correction_1M),
+        gibbs_calc.gibbs_energy(),
+        enthalpy_calc.zero_point_energy() / 1000.0
     )
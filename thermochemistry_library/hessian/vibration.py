@@ -7,7 +7,7 @@ ANGSTROM_PER_BOHR = 0.529177210903
 LIGHTSPEED_SI = 299792458
 AU_TO_INVCM = 219474.63
 
-@dataclass
+@dataclass(slots=True)
 class VibrationalAnalysis:
     hessian_input: np.ndarray
     masses_amu: np.ndarray
@@ -21,10 +21,22 @@ class VibrationalAnalysis:
     force_constants: np.ndarray = field(init=False, default=None)
     principal: np.ndarray = field(init=False, default=None)
 
+    hessian: np.ndarray = field(init=False, repr=False)
+    masses: np.ndarray = field(init=False, repr=False)
+    coords: np.ndarray = field(init=False, repr=False)
+    n_atoms: int = field(init=False, repr=False)
+    n_dir: int = field(init=False, repr=False)
+
+    # geometry terms, computed on first use and dropped if masses/coords change
+    _geometry: tuple = field(init=False, default=None, repr=False)
+    _com: np.ndarray = field(init=False, default=None, repr=False)
+    _inertia: np.ndarray = field(init=False, default=None, repr=False)
+    _inertia_eig: tuple = field(init=False, default=None, repr=False)
+
     def __post_init__(self):
-        self.hessian = np.array(self.hessian_input)
-        self.masses = np.array(self.masses_amu)
-        self.coords = np.array(self.coordinates)
+        self.hessian = np.asarray(self.hessian_input, dtype=np.float64)
+        self.masses = np.asarray(self.masses_amu, dtype=np.float64)
+        self.coords = np.asarray(self.coordinates, dtype=np.float64)
         self.n_atoms = len(self.masses)
         self.n_dir = 3 * self.n_atoms
 
@@ -35,86 +47,83 @@ class VibrationalAnalysis:
             return False
         return moments[0] < 1e-4 * moments[2]
 
+    def _check_geometry(self):
+        if self._geometry is not None:
+            masses, coords = self._geometry
+            if np.array_equal(masses, self.masses) and np.array_equal(coords, self.coords):
+                return
+        self._geometry = (self.masses.copy(), self.coords.copy())
+        self._com = self._inertia = self._inertia_eig = None
+
     def center_of_mass(self):
-        total_mass = np.sum(self.masses)
-        com = np.sum(self.masses[:, np.newaxis] * self.coords, axis=0) / total_mass
-        return com
+        self._check_geometry()
+        if self._com is None:
+            total_mass = np.sum(self.masses)
+            self._com = np.sum(self.masses[:, np.newaxis] * self.coords, axis=0) / total_mass
+        # hand out copies so callers can't modify the cached terms in place
+        return self._com.copy()
 
     def inertia_tensor(self):
-        com = self.center_of_mass()
-        shifted = self.coords - com
-
-        I = np.zeros((3, 3))
-
-        for i in range(self.n_atoms):
-            m = self.masses[i]
-            x, y, z = shifted[i]
-
-            I[0, 0] += m * (y**2 + z**2)
-            I[1, 1] += m * (x**2 + z**2)
-            I[2, 2] += m * (x**2 + y**2)
-            I[0, 1] -= m * x * y
-            I[0, 2] -= m * x * z
-            I[1, 2] -= m * y * z
-
-        I[1, 0] = I[0, 1]
-        I[2, 0] = I[0, 2]
-        I[2, 1] = I[1, 2]
-
-        return I
+        self._check_geometry()
+        if self._inertia is None:
+            com = self.center_of_mass()
+            shifted = self.coords - com
+
+            # I = sum_i m_i * (|r_i|^2 * 1 - r_i r_i^T), where tr(S) = sum_i m_i |r_i|^2
+            S = np.einsum("i,ij,ik->jk", self.masses, shifted, shifted)
+            self._inertia = np.trace(S) * np.eye(3) - S
+        return self._inertia.copy()
+
+    def _inertia_eigh(self):
+        # one eigh of the inertia tensor serves both the principal moments
+        # (ascending eigenvalues) and the principal axes of rotation
+        self._check_geometry()
+        if self._inertia_eig is None:
+            moments, axes = np.linalg.eigh(self.inertia_tensor())
+            moments.flags.writeable = axes.flags.writeable = False
+            self._inertia_eig = (moments, axes)
+        return self._inertia_eig
 
     def principal_moments(self):
-        I = self.inertia_tensor()
-        eigvals, _ = np.linalg.eigh(I)
-        self.principal = np.sort(eigvals)
+        moments, _ = self._inertia_eigh()
+        self.principal = moments.copy()
         return self.principal
 
     def _generate_translation_rotation_vectors(self):
         N = self.n_atoms
-        
+        sqrt_mass = np.sqrt(self.masses)
+        D = np.zeros(shape=(6, 3 * N))
+
         # translation vectors
-        d1 = np.zeros(shape=3 * N)
-        d1[::3] = np.sqrt(self.masses)
-        d2 = np.roll(d1, shift=1)
-        d3 = np.roll(d1, shift=2)
+        D[0, 0::3] = sqrt_mass
+        D[1, 1::3] = sqrt_mass
+        D[2, 2::3] = sqrt_mass
 
         # principal axes of rotation
-        I = self.inertia_tensor()
-        _, X = np.linalg.eigh(I)
+        _, X = self._inertia_eigh()
 
-        # rotation vectors
-        d4, d5, d6 = np.zeros(shape=(3 * N)), np.zeros(shape=(3 * N)), np.zeros(shape=(3 * N))
-        sqrt_mass = np.sqrt(self.masses)
+        # rotation vectors: the displacement of atom i for a rotation about
+        # principal axis k is sqrt(m_i) * X @ (e_k x P_i), with P = positions in the X frame
         positions = self.coords - self.center_of_mass()
-        
-        for i, (position, sqrt_mass_i) in enumerate(zip(positions, sqrt_mass)):
-            P = position @ X
-            d4[3 * i : 3 * i + 3] = (P[1] * X[:, 2] - P[2] * X[:, 1]) * sqrt_mass_i
-            d5[3 * i : 3 * i + 3] = (P[2] * X[:, 0] - P[0] * X[:, 2]) * sqrt_mass_i
-            d6[3 * i : 3 * i + 3] = (P[0] * X[:, 1] - P[1] * X[:, 0]) * sqrt_mass_i
+        P = positions @ X
+        rot = np.cross(np.eye(3)[:, np.newaxis, :], P) @ X.T
+        D[3:] = (rot * sqrt_mass[:, np.newaxis]).reshape(3, 3 * N)
 
         # check if the vectors are real and normalize
-        ds = []
-        for d in [d1, d2, d3, d4, d5, d6]:
-            norm_sq = np.dot(d, d)
-            if norm_sq > 1e-4:
-                d *= 1 / np.sqrt(norm_sq)
-                ds.append(d)
-
-        return np.stack(ds)
+        norm_sq = np.einsum("ij,ij->i", D, D)
+        real = norm_sq > 1e-4
+        return D[real] / np.sqrt(norm_sq[real, np.newaxis])
 
     def run(self):
         N = self.n_atoms
         
-        H_cart = self.hessian.copy()
-        H_cart *= ANGSTROM_PER_BOHR**2
-
-        # Mass-weighted Hessian
-        H_mwc = H_cart.copy()
-        
+        # Mass-weighted Hessian, with the bohr -> angstrom conversion folded
+        # into the row/column scaling so the Hessian is only written once
         mass_vec = np.repeat(self.masses, 3)
         inv_sqrt_mass = 1.0 / np.sqrt(mass_vec)
-        H_mwc = H_mwc * np.outer(inv_sqrt_mass, inv_sqrt_mass)
+        scale = ANGSTROM_PER_BOHR * inv_sqrt_mass
+        H_mwc = self.hessian * scale[:, np.newaxis]
+        H_mwc *= scale
         
         self.mass_weighted = H_mwc
 
@@ -129,40 +138,25 @@ class VibrationalAnalysis:
         # Eigenvalues to frequencies
         CONVERSION_FACTOR = 5140.4847323
 
-        freqs_cm = []
-        for val in e:
-            if val >= 0:
-                freqs_cm.append(np.sqrt(val) * CONVERSION_FACTOR)
-            else:
-                freqs_cm.append(-np.sqrt(abs(val)) * CONVERSION_FACTOR)
-        
-        freqs_cm = np.array(freqs_cm)
+        # Negative eigenvalues become imaginary (negative) frequencies,
+        # evaluated in place in a single output buffer
+        freqs_cm = np.abs(e)
+        np.sqrt(freqs_cm, out=freqs_cm)
+        np.copysign(freqs_cm, e, out=freqs_cm)
+        freqs_cm *= CONVERSION_FACTOR
 
-        # Mass diagonal matrix (M)
-        M = np.diag(inv_sqrt_mass)
+        # Get modes in cartesian coordinates, M^-1/2 applied as a row scaling
+        L_cart = inv_sqrt_mass[:, np.newaxis] * (D @ L)
 
-        # Get modes in cartesian coordinates
-        L_cart = M @ D @ L
-        
-        num_modes = L_cart.shape[1]
-        
         self.frequencies = freqs_cm
-        self.reduced_masses = np.zeros(num_modes)
-        self.force_constants = np.zeros(num_modes)
-        self.eigvecs = L_cart 
-
-        # Normalize and get reduced mass and force constants
-        for i in range(num_modes):
-            # Normalization
-            norm_sq = np.dot(L_cart[:, i], L_cart[:, i])
-            N_i = np.sqrt(1.0 / norm_sq)
-            
-            # Reduced mass
-            mu = N_i**2
-            self.reduced_masses[i] = mu
-            
-            # Force constant in mDyne/A
-            self.force_constants[i] = 5.89182e-7 * (freqs_cm[i]**2) * mu
+        self.eigvecs = L_cart
+
+        # Reduced mass is the inverse squared norm of each cartesian mode
+        norm_sq = np.einsum("ij,ij->j", L_cart, L_cart)
+        self.reduced_masses = 1.0 / norm_sq
+
+        # Force constant in mDyne/A
+        self.force_constants = 5.89182e-7 * freqs_cm**2 * self.reduced_masses
 
         return {
             "frequencies": self.frequencies,